@@ -22,8 +22,6 @@ ComfyUI-Xz3r0-Nodes V3 扩展入口。
 #    - 每个分类内部按节点类名字母序排列（A->Z）
 # 8) 新增节点时必须按上述规则插入，不要按“最近修改”或“功能关联”排序。
 
-import shutil  # noqa: I001
-
 from comfy_api.latest import ComfyExtension, io  # noqa: I001
 
 # ============================================
@@ -68,7 +66,7 @@ from .xnode.xvideoget import XVideoGet
 
 # =============================================
 
-from .xz3r0_utils import configure_logging, get_logger
+from .xz3r0_utils import configure_logging, find_ffmpeg, get_logger
 
 LOGGER = get_logger(__name__)
 
@@ -142,7 +140,7 @@ def is_ffmpeg_available() -> bool:
     说明：
         仅检测 requirements.txt 之外的额外环境依赖。
     """
-    return shutil.which("ffmpeg") is not None
+    return find_ffmpeg() is not None
 
 
 class Xz3r0NodesExtension(ComfyExtension):
@@ -11,7 +11,6 @@ import math
 import mimetypes
 import os
 import re
-import shutil
 import sqlite3
 import subprocess
 import sys
@@ -36,6 +35,7 @@ except Exception:  # pragma: no cover
 try:
     from ..xz3r0_utils import (
         ensure_unique_filename,
+        find_ffmpeg,
         generate_public_ref,
         get_critical_db_names,
         get_logger,
@@ -51,6 +51,7 @@ try:
 except ImportError:
     from xz3r0_utils import (
         ensure_unique_filename,
+        find_ffmpeg,
         generate_public_ref,
         get_critical_db_names,
         get_logger,
@@ -452,7 +453,7 @@ def favorites_db_path() -> Path:
 
 
 def locales_root() -> Path:
-    return Path(__file__).resolve().parent.parent / "locales"
+    return PROJECT_ROOT / "locales"
 
 
 def normalize_locale_code(value: str | None) -> str:
@@ -2389,7 +2390,7 @@ class MediaStore:
         size: int,
     ) -> Path | None:
         """使用 ffmpeg 从视频首帧生成缩略图。"""
-        ffmpeg = shutil.which("ffmpeg")
+        ffmpeg = find_ffmpeg()
         if not ffmpeg:
             LOGGER.debug(
                 "[xdatahub] ffmpeg not found, skip video thumb",
@@ -4062,7 +4063,7 @@ def _parse_media_chip_patch(value: Any) -> dict[str, Any]:
             patch["enable_image_thumb_cache"] = legacy
         if "enable_video_thumb_cache" not in value:
             patch["enable_video_thumb_cache"] = (
-                legacy and shutil.which("ffmpeg") is not None
+                legacy and find_ffmpeg() is not None
             )
     if "enable_image_thumb_cache" in value:
         patch["enable_image_thumb_cache"] = parse_bool(
@@ -4071,7 +4072,7 @@ def _parse_media_chip_patch(value: Any) -> dict[str, Any]:
     if "enable_video_thumb_cache" in value:
         patch["enable_video_thumb_cache"] = parse_bool(
             value.get("enable_video_thumb_cache")
-        ) and shutil.which("ffmpeg") is not None
+        ) and find_ffmpeg() is not None
     if "ui_locale" in value:
         raw_locale = str(value.get("ui_locale") or "").strip()
         if raw_locale:
@@ -4987,7 +4988,7 @@ async def api_lock_interrupt_requested(request: web.Request) -> web.Response:
 async def api_settings(request: web.Request) -> web.Response:
     try:
         settings = read_xdatahub_settings()
-        ffmpeg_available = shutil.which("ffmpeg") is not None
+        ffmpeg_available = find_ffmpeg() is not None
     except Exception as exc:
         LOGGER.exception(
             "[xdatahub] settings read failed: %s",
@@ -0,0 +1,102 @@
+import math
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("torchaudio")
+ffmpeg = pytest.importorskip("ffmpeg")
+pytest.importorskip("comfy.utils")
+pytest.importorskip("comfy_api.latest")
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from xnode.xaudiosave import XAudioSave  # noqa: E402
+
+requires_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None, reason="ffmpeg not installed"
+)
+
+SAMPLE_RATE = 48000
+TARGET_LUFS = -16.0
+
+
+def _sine(channels: int, seconds: float = 3.0) -> torch.Tensor:
+    t = torch.arange(int(SAMPLE_RATE * seconds), dtype=torch.float32)
+    tone = 0.1 * torch.sin(2 * math.pi * 440.0 * t / SAMPLE_RATE)
+    return tone.repeat(channels, 1)
+
+
+def _normalize(waveform: torch.Tensor, save_path: Path) -> torch.Tensor:
+    return XAudioSave._normalize_audio(
+        waveform,
+        SAMPLE_RATE,
+        TARGET_LUFS,
+        True,
+        -1.0,
+        False,
+        "Balanced",
+        False,
+        2.0,
+        save_path,
+        {"acodec": "pcm_f32le"},
+    )
+
+
+@requires_ffmpeg
+def test_mono_linear_pass_uses_unweighted_measurement(monkeypatch, tmp_path):
+    linear_kwargs = []
+    parsed_stats = []
+    original_filter = ffmpeg.nodes.FilterableStream.filter
+    original_parse = XAudioSave._parse_loudnorm_stats
+
+    def spy_filter(self, filter_name, *args, **kwargs):
+        if filter_name == "loudnorm" and kwargs.get("linear") == "true":
+            linear_kwargs.append(kwargs)
+        return original_filter(self, filter_name, *args, **kwargs)
+
+    def spy_parse(cls, stderr):
+        stats = original_parse(stderr)
+        parsed_stats.append(stats)
+        return stats
+
+    monkeypatch.setattr(ffmpeg.nodes.FilterableStream, "filter", spy_filter)
+    monkeypatch.setattr(
+        XAudioSave, "_parse_loudnorm_stats", classmethod(spy_parse)
+    )
+
+    _normalize(_sine(1), tmp_path / "mono.wav")
+
+    assert len(linear_kwargs) == 1
+    # 精确调整自身的 input_i 是对粗略结果的常规 (非 dual_mono) 测量
+    stats_after = parsed_stats[-1]
+    assert linear_kwargs[0]["measured_I"] == pytest.approx(
+        stats_after["input_i"], abs=0.1
+    )
+    assert stats_after["output_i"] == pytest.approx(TARGET_LUFS, abs=1.0)
+
+
+@requires_ffmpeg
+def test_failed_linear_pass_leaves_no_output_file(monkeypatch, tmp_path):
+    save_path = tmp_path / "failed.wav"
+
+    class FailingOutputs:
+        def overwrite_output(self):
+            return self
+
+        def run(self, **kwargs):
+            save_path.write_bytes(b"RIFF")
+            raise ffmpeg.Error("ffmpeg", b"", b"simulated failure")
+
+    monkeypatch.setattr(
+        ffmpeg, "merge_outputs", lambda *streams: FailingOutputs()
+    )
+
+    with pytest.raises(RuntimeError, match=XAudioSave.AUDIO_NORMALIZE_ERROR):
+        _normalize(_sine(2), save_path)
+
+    assert not save_path.exists()
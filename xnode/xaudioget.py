@@ -7,6 +7,7 @@ XAudioGet 节点模块 (V3 API)
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
 import av
@@ -122,8 +123,6 @@ class XAudioGet(io.ComfyNode):
 
     @staticmethod
     def _fingerprint_media_ref(media_ref: str) -> int:
-        import hashlib
-
         digest = hashlib.sha1(
             str(media_ref).encode("utf-8", errors="ignore")
         ).hexdigest()
@@ -5,12 +5,13 @@
 这个模块包含音频保存相关的节点。
 """
 
+import functools
 import json
+import logging
+import math
 import os
 import re
-import shutil
-import tempfile
-import time
+from datetime import datetime
 from pathlib import Path
 
 import comfy.utils
@@ -18,12 +19,12 @@ import ffmpeg
 import numpy as np
 import torch
 from comfy_api.latest import io
-from scipy.io import wavfile
 from torchaudio.transforms import Resample
 
 try:
     from ..xz3r0_utils import (
         ensure_unique_filename,
+        find_ffmpeg,
         get_logger,
         replace_datetime_tokens,
         resolve_output_subpath,
@@ -33,6 +34,7 @@ except ImportError:
     # 兼容直接执行测试脚本时从仓库根目录导入 xnode 的场景。
     from xz3r0_utils import (
         ensure_unique_filename,
+        find_ffmpeg,
         get_logger,
         replace_datetime_tokens,
         resolve_output_subpath,
@@ -47,9 +49,44 @@ except ImportError:
     COMFYUI_AVAILABLE = False
 
 NULL_DEVICE = "NUL" if os.name == "nt" else "/dev/null"
+# ebur128 在 info 级别输出的 Summary 行，如 "    I:  -23.0 LUFS"
+EBUR128_SUMMARY_PATTERN = re.compile(
+    rb"^\s*(I|LRA|Peak):\s*(\S+ \S+)\s*$", re.MULTILINE
+)
+# 单声道启用 dual_mono 时 loudnorm 按双声道计算响度，测量值偏高
+# 10*log10(2) dB
+DUAL_MONO_OFFSET_DB = 10 * math.log10(2)
+LOUDNORM_FIELDS = (
+    "input_i",
+    "input_lra",
+    "input_tp",
+    "input_thresh",
+    "output_i",
+    "output_lra",
+    "output_tp",
+    "output_thresh",
+)
 LOGGER = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def _get_resampler(
+    original_sr: int,
+    target_sr: int,
+    dtype: torch.dtype,
+    device: torch.device,
+) -> Resample:
+    """
+    Resample 构造时会生成 sinc 滤波核，按采样率/精度/设备缓存复用，
+    避免每次保存都重新计算；LRU 上限防止设备/采样率组合无限增长。
+    """
+    return Resample(
+        orig_freq=original_sr,
+        new_freq=target_sr,
+        dtype=dtype,
+    ).to(device)
+
+
 class XAudioSave(io.ComfyNode):
     """
     XAudioSave 音频保存节点 (V3)
@@ -81,11 +118,12 @@ class XAudioSave(io.ComfyNode):
            - 选择预设模式 (快速/平衡/缓慢)
            - 可选使用自定义压缩比覆盖预设值
            - 使用 acompressor 滤镜进行动态范围压缩
+           - 与步骤 2a 合并为同一条 FFmpeg 滤镜链
         2. 使用 loudnorm 双阶段处理进行 LUFS 标准化：
-           - 步骤 2a: 粗略标准化 (dual_mono=true) - 快速达到接近目标的 LUFS
-           - 步骤 2b: 测量粗略标准化后的音频信息
-           - 步骤 2c: 精确调整 (linear=true) - 基于粗略测量值进行精确线性归一化
-        3. 最终测量音频信息验证结果
+           - 步骤 2a: 粗略标准化 (dual_mono=true) - 快速达到接近目标的 LUFS，
+             同时输出粗略结果的测量信息
+           - 步骤 2b: 精确调整 (linear=true) - 基于粗略测量值进行精确线性归一化
+        3. 由精确调整输出的测量信息验证结果 (DEBUG 日志下额外 ebur128 复核)
 
     压缩预设参数说明：
         - 阈值自适应计算：threshold = actual_lufs + (
@@ -99,6 +137,8 @@ class XAudioSave(io.ComfyNode):
 
     峰值限制说明：
         - True Peak: 广播标准 True Peak 限制 (8x 过采样，精度高)
+        - 关闭 LUFS 标准化 (-70) 时，True Peak 限制改为 torch 内直接
+          检测 8x 过采样峰值并整体衰减，不再调用 FFmpeg
 
     输入：
         audio: 音频对象 (AUDIO)
@@ -132,6 +172,9 @@ class XAudioSave(io.ComfyNode):
         "96000": 96000,
         "192000": 192000,
     }
+    TRUE_PEAK_OVERSAMPLE = 8
+    # True Peak 检测按块过采样，每块原始采样点数 (每声道)
+    TRUE_PEAK_BLOCK_SAMPLES = 1 << 16
     OUTPUT_DIRECTORY_ERROR = "Unable to create output directory"
     INVALID_SAVE_PATH_ERROR = "Invalid save path"
     RELATIVE_PATH_ERROR = "Unable to build relative save path"
@@ -140,6 +183,10 @@ class XAudioSave(io.ComfyNode):
     AUDIO_SAVE_ERROR = "Audio file saving failed"
     FILE_SAVE_VALIDATION_ERROR = "Saved audio file validation failed"
     INVALID_FORMAT_ERROR = "format must be either WAV or FLAC"
+    FFMPEG_NOT_FOUND_ERROR = (
+        "FFmpeg executable not found. "
+        "Please install FFmpeg and add it to your system PATH."
+    )
 
     @classmethod
     def define_schema(cls):
@@ -319,13 +366,14 @@ class XAudioSave(io.ComfyNode):
         output_dir = cls._get_output_directory()
         output_format = cls._normalize_output_format(format)
         # 处理日期时间标识符和安全过滤
+        now = datetime.now()
         safe_filename_prefix = sanitize_path_component(filename_prefix)
         safe_filename_prefix = replace_datetime_tokens(
-            safe_filename_prefix
+            safe_filename_prefix, now=now
         )
 
         safe_subfolder = sanitize_path_component(subfolder)
-        safe_subfolder = replace_datetime_tokens(safe_subfolder)
+        safe_subfolder = replace_datetime_tokens(safe_subfolder, now=now)
 
         try:
             save_dir = resolve_output_subpath(output_dir, safe_subfolder)
@@ -347,13 +395,18 @@ class XAudioSave(io.ComfyNode):
             waveform = waveform.squeeze(0)
         if waveform.dim() == 1:
             waveform = waveform.unsqueeze(0)
+        # squeeze/unsqueeze 及上游切片可能得到非连续视图，上游经 NumPy
+        # 处理时还常是 float64；这里统一整理为连续 float32，后续重采样、
+        # 峰值检测和 PCM 导出都按 32-bit 处理，已符合时不产生拷贝。
+        waveform = waveform.to(torch.float32).contiguous()
 
         # 获取目标采样率
         target_sr = cls.SAMPLE_RATES[sample_rate]
 
         # 定义处理步骤数
-        # 步骤 1: 重采样，步骤 2: 文件名生成，步骤 3-10: 音频处理各阶段
-        total_steps = 10
+        # 步骤 1: 重采样，步骤 2: LUFS 标准化，步骤 3: 文件保存
+        # FFmpeg 子进程内部无法回报进度，只在这三个节点更新进度条。
+        total_steps = 3
         progress_bar = comfy.utils.ProgressBar(total_steps)
 
         # 重采样音频 (如果需要)
@@ -367,7 +420,6 @@ class XAudioSave(io.ComfyNode):
         final_filename = ensure_unique_filename(
             save_dir, base_filename, extension
         )
-        progress_bar.update_absolute(2)
 
         try:
             save_path = resolve_output_subpath(
@@ -383,58 +435,37 @@ class XAudioSave(io.ComfyNode):
         final_lufs = target_lufs if target_lufs > -70 else None
         if final_lufs is not None:
             if output_format == "WAV":
-                waveform = cls._normalize_audio(
-                    waveform,
-                    target_sr,
-                    final_lufs,
-                    enable_peak_limiter,
-                    peak_limit,
-                    enable_compression,
-                    compression_mode,
-                    use_custom_ratio,
-                    custom_ratio,
-                    save_path,
-                    progress_bar,
-                    current_step=2,
-                )
+                output_options = {"acodec": "pcm_f32le"}
             else:
-                with tempfile.NamedTemporaryFile(
-                    suffix=".wav", delete=False
-                ) as temp_output:
-                    temp_output_path = temp_output.name
-
-                try:
-                    waveform = cls._normalize_audio(
-                        waveform,
-                        target_sr,
-                        final_lufs,
-                        enable_peak_limiter,
-                        peak_limit,
-                        enable_compression,
-                        compression_mode,
-                        use_custom_ratio,
-                        custom_ratio,
-                        Path(temp_output_path),
-                        progress_bar,
-                        current_step=2,
-                    )
-                    metadata = cls._generate_metadata(
+                output_options = cls._build_flac_output_options(
+                    cls._generate_metadata(
                         cls.hidden.prompt,
                         cls.hidden.extra_pnginfo,
                     )
-                    cls._save_flac_from_source(
-                        source_path=temp_output_path,
-                        target_path=save_path,
-                        metadata=metadata,
-                    )
-                finally:
-                    if os.path.exists(temp_output_path):
-                        try:
-                            os.remove(temp_output_path)
-                        except OSError:
-                            pass
+                )
+            waveform = cls._normalize_audio(
+                waveform,
+                target_sr,
+                final_lufs,
+                enable_peak_limiter,
+                peak_limit,
+                enable_compression,
+                compression_mode,
+                use_custom_ratio,
+                custom_ratio,
+                save_path,
+                output_options,
+                progress_bar,
+                current_step=1,
+            )
         else:
-            # 没有 LUFS 标准化时按目标格式直接保存。
+            # 没有 LUFS 标准化时按目标格式直接保存，峰值限制在 torch 内完成。
+            if enable_peak_limiter:
+                waveform = cls._limit_true_peak(
+                    waveform,
+                    target_sr,
+                    peak_limit,
+                )
             if output_format == "WAV":
                 cls._save_wav_32bit_float(
                     waveform,
@@ -452,7 +483,7 @@ class XAudioSave(io.ComfyNode):
                     sample_rate=target_sr,
                     metadata=metadata,
                 )
-            progress_bar.update_absolute(total_steps)
+        progress_bar.update_absolute(total_steps)
 
         cls._validate_saved_file(save_path)
 
@@ -482,9 +513,85 @@ class XAudioSave(io.ComfyNode):
         Returns:
             重采样后的音频波形
         """
-        resampler = Resample(orig_freq=original_sr, new_freq=target_sr)
+        if original_sr == target_sr:
+            return waveform
+
+        resampler = _get_resampler(
+            original_sr, target_sr, waveform.dtype, waveform.device
+        )
         return resampler(waveform)
 
+    @classmethod
+    def _limit_true_peak(
+        cls, waveform: torch.Tensor, sample_rate: int, peak_limit: float
+    ) -> torch.Tensor:
+        """
+        True Peak 峰值限制 (纯 torch 实现)
+
+        使用 8x 过采样检测真实峰值，超过限制值时对整段音频应用
+        统一线性增益，不改变动态。过采样按块进行，峰值内存与音频
+        长度无关。
+
+        Args:
+            waveform: 音频波形张量 (channels, samples)
+            sample_rate: 采样率
+            peak_limit: 峰值限制值 (dB)
+
+        Returns:
+            峰值限制后的音频波形
+        """
+        peak_limit_db = peak_limit if peak_limit < 0 else -1.0
+        peak_limit_linear = 10 ** (peak_limit_db / 20)
+
+        num_samples = waveform.shape[-1]
+        if num_samples == 0:
+            return waveform
+
+        factor = cls.TRUE_PEAK_OVERSAMPLE
+        block_size = cls.TRUE_PEAK_BLOCK_SAMPLES
+        try:
+            resampler = _get_resampler(
+                sample_rate,
+                sample_rate * factor,
+                waveform.dtype,
+                waveform.device,
+            )
+            # 每块两侧各多取一个滤波核宽度的上下文，块内结果与整段
+            # 一次过采样逐点一致；只对块中心部分取峰值。
+            overlap = resampler.kernel.shape[-1]
+            block_peaks = []
+            for start in range(0, num_samples, block_size):
+                end = min(start + block_size, num_samples)
+                context_start = max(start - overlap, 0)
+                context_end = min(end + overlap, num_samples)
+                oversampled = resampler(
+                    waveform[..., context_start:context_end]
+                )
+                head = (start - context_start) * factor
+                core = oversampled[..., head:head + (end - start) * factor]
+                # inf 范数即最大绝对值，一次归约完成，不额外生成
+                # |x| 中间张量；各块峰值留在设备上，最后统一同步一次。
+                block_peaks.append(
+                    torch.linalg.vector_norm(core, ord=float("inf"))
+                )
+                del oversampled, core
+            true_peak = float(torch.stack(block_peaks).max())
+        except RuntimeError as exc:
+            raise RuntimeError(cls.AUDIO_NORMALIZE_ERROR) from exc
+
+        if true_peak <= peak_limit_linear:
+            return waveform
+
+        gain = peak_limit_linear / true_peak
+        LOGGER.info(
+            "[XAudioSave] True Peak %.2f dBTP exceeds limit %.2f dB, "
+            "applying %.2f dB gain",
+            20 * math.log10(true_peak),
+            peak_limit_db,
+            20 * math.log10(gain),
+        )
+        return waveform * gain
+
     @classmethod
     def _normalize_output_format(cls, output_format: str) -> str:
         """
@@ -508,6 +615,7 @@ class XAudioSave(io.ComfyNode):
         use_custom_ratio: bool,
         custom_ratio: float,
         final_save_path: Path,
+        output_options: dict[str, str],
         progress_bar=None,
         current_step: int = 0,
     ) -> torch.Tensor:
@@ -525,13 +633,15 @@ class XAudioSave(io.ComfyNode):
             use_custom_ratio: 是否使用自定义压缩比
             custom_ratio: 自定义压缩比
             final_save_path: 最终保存路径
+            output_options: 最终文件的 FFmpeg 编码参数
             progress_bar: 进度条对象 (可选)
             current_step: 当前进度步数
 
         Returns:
             标准化后的音频波形
         """
-        files_to_cleanup = []
+        verify_process = None
+        completed = False
         audio_np = cls._prepare_waveform_for_io(waveform)
 
         try:
@@ -539,53 +649,18 @@ class XAudioSave(io.ComfyNode):
                 "[XAudioSave] ===== ♾️Starting audio processing♾️ ====="
             )
 
-            ffmpeg_path = shutil.which("ffmpeg")
-            if not ffmpeg_path:
-                raise RuntimeError(
-                    "FFmpeg executable not found. "
-                    "Please install FFmpeg and add it to your system PATH."
-                )
-
-            with tempfile.NamedTemporaryFile(
-                suffix=".wav", delete=False
-            ) as input_file:
-                input_path = input_file.name
-                files_to_cleanup.append(input_path)
-
-            with tempfile.NamedTemporaryFile(
-                suffix=".wav", delete=False
-            ) as temp_file:
-                temp_path = temp_file.name
-
-            try:
-                audio_data = np.transpose(audio_np, (1, 0))
-                audio_data = audio_data.astype(np.float32)
-                wavfile.write(temp_path, sample_rate, audio_data)
-
-                time.sleep(0.01)
-
-                (
-                    ffmpeg.input(temp_path)
-                    .output(
-                        input_path,
-                        acodec="pcm_f32le",
-                        **{"loglevel": "error"},
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
-                )
-            finally:
-                if os.path.exists(temp_path):
-                    try:
-                        os.remove(temp_path)
-                    except OSError:
-                        pass
-
-            # 步骤 3: 准备完成
-            if progress_bar:
-                progress_bar.update_absolute(current_step + 1)
+            if find_ffmpeg() is None:
+                raise RuntimeError(cls.FFMPEG_NOT_FOUND_ERROR)
 
-            current_input_path = input_path
+            # 原始波形以交错 f32le 裸 PCM 通过 stdin 直接送入 FFmpeg，
+            # 不再先落盘临时 WAV 再转码一次；以字节视图传入，免去
+            # tobytes() 的整段拷贝。
+            pcm_bytes = memoryview(audio_np).cast("B")
+            pcm_input_kwargs = {
+                "format": "f32le",
+                "ar": sample_rate,
+                "ac": audio_np.shape[1],
+            }
 
             peak_limit_db = peak_limit if peak_limit < 0 else -1.0
             tp_value = peak_limit_db if enable_peak_limiter else 0
@@ -597,43 +672,23 @@ class XAudioSave(io.ComfyNode):
                 tp_value,
             )
 
-            stdout, stderr = (
-                ffmpeg.input(current_input_path)
-                .filter(
-                    "loudnorm", I=target_lufs, TP=tp_value, print_format="json"
-                )
-                .output(NULL_DEVICE, format="null")
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
-            )
-            stderr_str = stderr.decode("utf-8")
-
-            stats_json = None
-            json_match = re.search(r'\{[^{}]*"input_i"[^{}]*\}', stderr_str)
-            if json_match:
-                try:
-                    stats_json = json.loads(json_match.group(0))
-                except json.JSONDecodeError:
-                    raise RuntimeError(cls.AUDIO_NORMALIZE_ERROR) from None
-
-            if stats_json is None:
-                raise RuntimeError(cls.AUDIO_NORMALIZE_ERROR)
-
-            # 步骤 4: 初始测量完成
-            if progress_bar:
-                progress_bar.update_absolute(current_step + 2)
-
             acompressor_filter = None
 
-            actual_lufs = float(stats_json["input_i"])
+            if enable_compression:
+                # 只有压缩器的自适应阈值依赖原始 LUFS，未启用压缩时
+                # 直接复用粗略标准化输出的 input_i，省掉一次测量。
+                stats_json = cls._measure_loudnorm_stats(
+                    pcm_bytes, pcm_input_kwargs, target_lufs, tp_value
+                )
+
+                actual_lufs = stats_json["input_i"]
 
-            LOGGER.info(
-                "[XAudioSave] Audio LUFS: %.2f dB, Target LUFS: %.2f dB",
-                actual_lufs,
-                target_lufs,
-            )
+                LOGGER.info(
+                    "[XAudioSave] Audio LUFS: %.2f dB, Target LUFS: %.2f dB",
+                    actual_lufs,
+                    target_lufs,
+                )
 
-            if enable_compression:
                 preset_configs = {
                     "Fast": {
                         "base_offset": 6.0,
@@ -700,196 +755,147 @@ class XAudioSave(io.ComfyNode):
                     preset_name,
                     ratio_info,
                 )
-
-            if acompressor_filter:
-                with tempfile.NamedTemporaryFile(
-                    suffix=".wav", delete=False
-                ) as compressed_file:
-                    compressed_path = compressed_file.name
-                    files_to_cleanup.append(compressed_path)
-
-                stdout_comp, stderr_comp = (
-                    ffmpeg.input(current_input_path)
-                    .output(
-                        compressed_path,
-                        acodec="pcm_f32le",
-                        af=acompressor_filter,
-                        **{"loglevel": "error"},
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
-                )
-
-                current_input_path = compressed_path
-                LOGGER.info("[XAudioSave] Compression completed")
             else:
                 LOGGER.debug("[XAudioSave] Compression disabled")
 
-            # 步骤 5: 压缩处理完成
-            if progress_bar:
-                progress_bar.update_absolute(current_step + 3)
-
             loudnorm_tp = tp_value if enable_peak_limiter else 0
 
-            rough_lufs_filter = (
-                f"loudnorm=I={target_lufs}:TP={loudnorm_tp}:dual_mono=true"
-            )
-
-            with tempfile.NamedTemporaryFile(
-                suffix=".wav", delete=False
-            ) as rough_file:
-                rough_path = rough_file.name
-                files_to_cleanup.append(rough_path)
+            # 压缩器与粗略标准化合并为同一条滤镜链，并让 loudnorm 直接
+            # 输出 JSON：output_* 即粗略结果的测量值，无需再单独测量。
+            rough_filters = [
+                f"loudnorm=I={target_lufs}:TP={loudnorm_tp}:dual_mono=true:"
+                f"print_format=json"
+            ]
+            if acompressor_filter:
+                rough_filters.insert(0, acompressor_filter)
 
+            # loudnorm 内部固定以 192 kHz 处理并按该采样率输出，
+            # 两次标准化都必须保留 ar=sample_rate 才能回到原采样率。
+            # 粗略结果同样以 f32le 裸 PCM 留在内存中交给精确调整，
+            # 不再经过临时 WAV。
             stdout_rough, stderr_rough = (
-                ffmpeg.input(current_input_path)
+                ffmpeg.input("pipe:", **pcm_input_kwargs)
                 .output(
-                    rough_path,
+                    "pipe:",
+                    format="f32le",
                     acodec="pcm_f32le",
-                    af=rough_lufs_filter,
+                    af=",".join(rough_filters),
                     ar=sample_rate,
-                    **{"loglevel": "error"},
                 )
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+                .run(
+                    input=pcm_bytes,
+                    capture_stdout=True,
+                    capture_stderr=True,
+                )
             )
+            stats_rough = cls._parse_loudnorm_stats(stderr_rough)
+
+            # 单声道时 dual_mono 同样作用于 loudnorm 的输出测量，
+            # output_* 比常规测量偏高约 3 dB；精确调整不启用 dual_mono，
+            # 因此需对粗略结果重新做一次常规测量。多声道时 dual_mono
+            # 不生效，直接复用粗略标准化输出的 output_*。
+            if audio_np.shape[1] == 1:
+                stats_measured = cls._measure_loudnorm_stats(
+                    stdout_rough, pcm_input_kwargs, target_lufs, loudnorm_tp
+                )
+                measured_prefix = "input"
+                input_lufs = stats_rough["input_i"] - DUAL_MONO_OFFSET_DB
+            else:
+                stats_measured = stats_rough
+                measured_prefix = "output"
+                input_lufs = stats_rough["input_i"]
 
-            _, stderr_rough_measure = (
-                ffmpeg.input(str(rough_path))
+            if acompressor_filter:
+                LOGGER.info("[XAudioSave] Compression completed")
+            else:
+                LOGGER.info(
+                    "[XAudioSave] Audio LUFS: %.2f dB, Target LUFS: %.2f dB",
+                    input_lufs,
+                    target_lufs,
+                )
+
+            linear_streams = (
+                ffmpeg.input("pipe:", **pcm_input_kwargs)
                 .filter(
                     "loudnorm",
                     I=target_lufs,
                     TP=loudnorm_tp,
+                    linear="true",
+                    measured_I=stats_measured[f"{measured_prefix}_i"],
+                    measured_LRA=stats_measured[f"{measured_prefix}_lra"],
+                    measured_TP=stats_measured[f"{measured_prefix}_tp"],
+                    measured_thresh=stats_measured[
+                        f"{measured_prefix}_thresh"
+                    ],
                     print_format="json",
                 )
-                .output(NULL_DEVICE, format="null")
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+                .filter_multi_output("asplit")
             )
-            stderr_rough_measure_str = stderr_rough_measure.decode("utf-8")
-
-            stats_rough = None
-            json_match_rough = re.search(
-                r'\{[^{}]*"input_i"[^{}]*\}', stderr_rough_measure_str
-            )
-            if json_match_rough:
-                try:
-                    stats_rough = json.loads(json_match_rough.group(0))
-                except json.JSONDecodeError:
-                    raise RuntimeError(cls.AUDIO_NORMALIZE_ERROR) from None
-
-            if stats_rough is None:
-                raise RuntimeError(cls.AUDIO_NORMALIZE_ERROR)
-
-            # 步骤 6: 粗略标准化完成
-            if progress_bar:
-                progress_bar.update_absolute(current_step + 4)
-
-            rough_i = str(stats_rough["input_i"])
-            rough_lra = str(stats_rough["input_lra"])
-            rough_tp = str(stats_rough["input_tp"])
-            rough_thresh = str(stats_rough["input_thresh"])
-
-            loudnorm_filter = (
-                f"loudnorm=I={target_lufs}:TP={loudnorm_tp}:linear=true:"
-                f"measured_I={rough_i}:measured_LRA={rough_lra}:"
-                f"measured_TP={rough_tp}:measured_thresh={rough_thresh}"
-            )
-
-            with tempfile.NamedTemporaryFile(
-                suffix=".wav", delete=False
-            ) as lufs_file:
-                lufs_path = lufs_file.name
-                files_to_cleanup.append(lufs_path)
 
-            stdout_lufs, stderr_lufs = (
-                ffmpeg.input(rough_path)
-                .output(
-                    lufs_path,
-                    acodec="pcm_f32le",
-                    af=loudnorm_filter,
-                    ar=sample_rate,
-                    **{"loglevel": "error"},
+            # 精确标准化只运行一次：asplit 一路直接编码为最终文件，
+            # 另一路以 f32le 裸 PCM 从 stdout 读回用于构建输出张量。
+            stdout_after, stderr_after = (
+                ffmpeg.merge_outputs(
+                    linear_streams[0].output(
+                        str(final_save_path),
+                        ar=sample_rate,
+                        **output_options,
+                    ),
+                    linear_streams[1].output(
+                        "pipe:",
+                        format="f32le",
+                        acodec="pcm_f32le",
+                        ar=sample_rate,
+                    ),
                 )
                 .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
-            )
-
-            _, stderr_after = (
-                ffmpeg.input(str(lufs_path))
-                .filter(
-                    "loudnorm", I=target_lufs, TP=tp_value, print_format="json"
+                .run(
+                    input=stdout_rough,
+                    capture_stdout=True,
+                    capture_stderr=True,
                 )
-                .output(NULL_DEVICE, format="null")
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
-            )
-            stderr_after_str = stderr_after.decode("utf-8")
-
-            stats_after = None
-            json_match_after = re.search(
-                r'\{[^{}]*"input_i"[^{}]*\}', stderr_after_str
             )
-            if json_match_after:
-                try:
-                    stats_after = json.loads(json_match_after.group(0))
-                except json.JSONDecodeError:
-                    raise RuntimeError(cls.AUDIO_NORMALIZE_ERROR) from None
-
-            if stats_after is None:
-                raise RuntimeError(cls.AUDIO_NORMALIZE_ERROR)
-
-            after_i = str(stats_after["input_i"])
-            after_lra = str(stats_after["input_lra"])
-            after_tp = str(stats_after["input_tp"])
-            after_thresh = str(stats_after["input_thresh"])
+            stats_after = cls._parse_loudnorm_stats(stderr_after)
             LOGGER.info(
                 "[XAudioSave] Finished LUFS - I: %s, LRA: %s, TP: %s, "
                 "Thresh: %s",
-                after_i,
-                after_lra,
-                after_tp,
-                after_thresh,
+                stats_after["output_i"],
+                stats_after["output_lra"],
+                stats_after["output_tp"],
+                stats_after["output_thresh"],
             )
 
-            # 步骤 7: 精确标准化完成
+            # 精确标准化完成
             if progress_bar:
-                progress_bar.update_absolute(current_step + 5)
+                progress_bar.update_absolute(current_step + 1)
 
-            _, verify_stderr = (
-                ffmpeg.input(str(lufs_path))
-                .filter("ebur128", peak="true")
-                .output(
-                    NULL_DEVICE,
-                    format="null",
-                    **{"loglevel": "error"},
+            audio_data_out = np.frombuffer(
+                stdout_after, dtype=np.float32
+            ).reshape(-1, audio_np.shape[1])
+
+            # ebur128 复核结果只输出到 DEBUG 日志，未开启 DEBUG 时
+            # 跳过这次完整解码，loudnorm 的 output_* 已足够反映结果。
+            # 复核进程在后台运行，与下面的张量转换重叠执行。逐帧日志
+            # 降到 verbose 级别，stderr 只剩 Summary，管道不会在
+            # communicate() 前写满而阻塞 FFmpeg。
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                verify_process = (
+                    ffmpeg.input(str(final_save_path))
+                    .filter("ebur128", peak="true", framelog="verbose")
+                    .output(NULL_DEVICE, format="null")
+                    .overwrite_output()
+                    .run_async(pipe_stdout=True, pipe_stderr=True)
                 )
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
-            )
-
-            verify_output = verify_stderr.decode("utf-8")
-            for line in reversed(verify_output.split("\n")):
-                if "I:" in line or "TP:" in line or "LRA:" in line:
-                    LOGGER.debug("[XAudioSave] Final: %s", line.strip())
 
-            # 步骤 8: 最终验证完成
-            if progress_bar:
-                progress_bar.update_absolute(current_step + 6)
-
-            shutil.copy2(lufs_path, final_save_path)
-
-            sample_rate_out, audio_data_out = wavfile.read(
-                lufs_path, mmap=True
+            # 目标设备为 CUDA 时直接写入锁页内存，non_blocking 的
+            # H2D 拷贝才能真正异步；转置也在这一次拷贝中完成。
+            waveform_processed = torch.empty(
+                (audio_data_out.shape[1], audio_data_out.shape[0]),
+                dtype=torch.float32,
+                pin_memory=waveform.device.type == "cuda",
             )
-
-            if audio_data_out.ndim == 1:
-                audio_data_out = audio_data_out.reshape(-1, 1)
-
-            waveform_processed = torch.from_numpy(
-                np.transpose(audio_data_out, (1, 0))
-            ).float()
-            waveform_processed = torch.clamp(waveform_processed, -1.0, 1.0)
+            waveform_processed.numpy()[...] = audio_data_out.T
+            waveform_processed.clamp_(-1.0, 1.0)
 
             try:
                 waveform_processed = waveform_processed.to(
@@ -903,23 +909,93 @@ class XAudioSave(io.ComfyNode):
                 )
                 waveform_processed = waveform_processed.to("cpu")
 
-            # 步骤 9: 文件保存完成
-            if progress_bar:
-                progress_bar.update_absolute(current_step + 7)
+            if verify_process is not None:
+                _, verify_stderr = verify_process.communicate()
+                # Summary 位于 stderr 末尾，同名字段以最后一次出现为准
+                summary = {
+                    key.decode(): value.decode()
+                    for key, value in EBUR128_SUMMARY_PATTERN.findall(
+                        verify_stderr
+                    )
+                }
+                LOGGER.debug(
+                    "[XAudioSave] Final - I: %s, LRA: %s, TP: %s",
+                    summary.get("I", "n/a"),
+                    summary.get("LRA", "n/a"),
+                    summary.get("Peak", "n/a"),
+                )
 
             LOGGER.info(
                 "[XAudioSave] ===== ♾️Audio processing completed♾️ ====="
             )
+            completed = True
             return waveform_processed
         except (ffmpeg.Error, OSError, ValueError, RuntimeError) as exc:
             raise RuntimeError(cls.AUDIO_NORMALIZE_ERROR) from exc
         finally:
-            for path in files_to_cleanup:
-                if os.path.exists(path):
-                    try:
-                        os.remove(path)
-                    except OSError:
-                        pass
+            if verify_process is not None and verify_process.poll() is None:
+                verify_process.kill()
+                verify_process.wait()
+            # 精确标准化直接写入最终路径，失败时删除可能残缺的文件，
+            # 避免以正式文件名留在输出目录中。
+            if not completed:
+                try:
+                    final_save_path.unlink(missing_ok=True)
+                except OSError:
+                    LOGGER.warning(
+                        "[XAudioSave] Could not remove incomplete file: %s",
+                        final_save_path.name,
+                    )
+
+    @classmethod
+    def _measure_loudnorm_stats(
+        cls,
+        pcm: bytes | memoryview,
+        pcm_input_kwargs: dict,
+        target_lufs: float,
+        tp_value: float,
+    ) -> dict[str, float]:
+        """
+        对 f32le 裸 PCM 做一次不输出音频的 loudnorm 常规测量。
+        """
+        _, stderr = (
+            ffmpeg.input("pipe:", **pcm_input_kwargs)
+            .filter(
+                "loudnorm",
+                I=target_lufs,
+                TP=tp_value,
+                print_format="json",
+            )
+            .output(NULL_DEVICE, format="null")
+            .overwrite_output()
+            .run(
+                input=pcm,
+                capture_stderr=True,
+            )
+        )
+        return cls._parse_loudnorm_stats(stderr)
+
+    @classmethod
+    def _parse_loudnorm_stats(cls, stderr: bytes) -> dict[str, float]:
+        """
+        从 FFmpeg stderr 中提取 loudnorm 的 JSON 测量结果。
+
+        loudnorm 的 JSON 是 stderr 中最后一个不含嵌套的花括号块，
+        直接在原始字节上从末尾定位切片，只把用到的测量字段转换为 float。
+
+        Raises:
+            RuntimeError: 未找到或无法解析测量结果时抛出
+        """
+        start = stderr.rfind(b"{")
+        end = stderr.find(b"}", start)
+        if start < 0 or end < 0:
+            raise RuntimeError(cls.AUDIO_NORMALIZE_ERROR)
+
+        try:
+            stats = json.loads(stderr[start : end + 1])
+            return {field: float(stats[field]) for field in LOUDNORM_FIELDS}
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            raise RuntimeError(cls.AUDIO_NORMALIZE_ERROR) from None
 
     @classmethod
     def _save_wav_32bit_float(
@@ -937,45 +1013,9 @@ class XAudioSave(io.ComfyNode):
             path: 保存路径
             sample_rate: 采样率
         """
-        audio_np = cls._prepare_waveform_for_io(waveform)
-
-        ffmpeg_path = shutil.which("ffmpeg")
-        if not ffmpeg_path:
-            raise RuntimeError(
-                "FFmpeg executable not found. "
-                "Please install FFmpeg and add it to your system PATH."
-            )
-
-        with tempfile.NamedTemporaryFile(
-            suffix=".wav", delete=False
-        ) as temp_file:
-            temp_path = temp_file.name
-
-        try:
-            audio_data = np.transpose(audio_np, (1, 0))
-            wavfile.write(temp_path, sample_rate, audio_data)
-
-            with open(temp_path, "ab") as f:
-                os.fsync(f.fileno())
-
-            (
-                ffmpeg.input(temp_path)
-                .output(
-                    str(path),
-                    acodec="pcm_f32le",
-                    **{"loglevel": "error"},
-                )
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
-            )
-        except (ffmpeg.Error, OSError, ValueError) as exc:
-            raise RuntimeError(cls.AUDIO_SAVE_ERROR) from exc
-        finally:
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except OSError:
-                    pass
+        cls._encode_waveform(
+            waveform, path, sample_rate, {"acodec": "pcm_f32le"}
+        )
 
     @classmethod
     def _save_flac_from_waveform(
@@ -986,57 +1026,66 @@ class XAudioSave(io.ComfyNode):
         metadata: dict | None = None,
     ) -> None:
         """
-        将 float 波形写临时 WAV，再以 FLAC(s32) 无损压缩导出。
+        将 float 波形以 FLAC(s32) 无损压缩导出，并写入工作流元数据。
         """
-        audio_np = cls._prepare_waveform_for_io(waveform)
-        with tempfile.NamedTemporaryFile(
-            suffix=".wav", delete=False
-        ) as temp_file:
-            temp_path = temp_file.name
-
-        try:
-            audio_data = np.transpose(audio_np, (1, 0))
-            wavfile.write(temp_path, sample_rate, audio_data)
-            cls._save_flac_from_source(
-                source_path=temp_path,
-                target_path=path,
-                metadata=metadata,
-            )
-        finally:
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except OSError:
-                    pass
+        cls._encode_waveform(
+            waveform,
+            path,
+            sample_rate,
+            cls._build_flac_output_options(metadata),
+        )
 
     @classmethod
-    def _save_flac_from_source(
+    def _encode_waveform(
         cls,
-        source_path: str | Path,
-        target_path: Path,
-        metadata: dict | None = None,
+        waveform: torch.Tensor,
+        path: Path,
+        sample_rate: int,
+        output_options: dict[str, str],
     ) -> None:
         """
-        将源音频编码为 FLAC，并写入工作流元数据。
+        将波形以 f32le 裸 PCM 通过 stdin 送入 FFmpeg 编码为目标文件。
         """
-        output_kwargs = {
-            "acodec": "flac",
-            "sample_fmt": "s32",
-            **{"loglevel": "error"},
-        }
-        output_kwargs.update(
-            cls._build_ffmpeg_metadata_options(metadata)
-        )
+        audio_np = cls._prepare_waveform_for_io(waveform)
+
+        if find_ffmpeg() is None:
+            raise RuntimeError(cls.FFMPEG_NOT_FOUND_ERROR)
+
         try:
             (
-                ffmpeg.input(str(source_path))
-                .output(str(target_path), **output_kwargs)
+                ffmpeg.input(
+                    "pipe:",
+                    format="f32le",
+                    ar=sample_rate,
+                    ac=audio_np.shape[1],
+                )
+                .output(
+                    str(path),
+                    **output_options,
+                    **{"loglevel": "error"},
+                )
                 .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+                .run(
+                    input=memoryview(audio_np).cast("B"),
+                    capture_stderr=True,
+                )
             )
         except (ffmpeg.Error, OSError, ValueError) as exc:
             raise RuntimeError(cls.AUDIO_SAVE_ERROR) from exc
 
+    @classmethod
+    def _build_flac_output_options(
+        cls, metadata: dict | None
+    ) -> dict[str, str]:
+        """
+        生成 FLAC(s32) 编码参数，并附带工作流元数据。
+        """
+        return {
+            "acodec": "flac",
+            "sample_fmt": "s32",
+            **cls._build_ffmpeg_metadata_options(metadata),
+        }
+
     @classmethod
     def _generate_metadata(cls, prompt, extra_pnginfo):
         """
@@ -1072,11 +1121,15 @@ class XAudioSave(io.ComfyNode):
     def _prepare_waveform_for_io(cls, waveform: torch.Tensor) -> np.ndarray:
         """
         将音频张量转换为适合磁盘读写的 NumPy 格式。
+
+        返回 (samples, channels) 的 C 连续 float32 数组，即交错 PCM
+        布局，可直接作为 f32le 字节流送入 FFmpeg。
+        转置在张量层完成，整个过程最多只产生一次拷贝。
         """
         try:
             prepared = waveform.detach()
             prepared = prepared.to(device="cpu", dtype=torch.float32)
-            prepared = prepared.contiguous()
+            prepared = prepared.transpose(0, 1).contiguous()
             return prepared.numpy()
         except (RuntimeError, TypeError, ValueError) as exc:
             raise RuntimeError(cls.AUDIO_TENSOR_PREPARE_ERROR) from exc
@@ -32,6 +32,7 @@ except ImportError:
 LOGGER = get_logger(__name__)
 XDataSeedType = io.Custom("xdata_seed")
 XDataStringType = io.Custom("xdata_string")
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
 class XDataSave(io.ComfyNode):
@@ -217,8 +218,7 @@ class XDataSave(io.ComfyNode):
     @classmethod
     def _get_data_root(cls) -> Path:
         """返回数据保存根目录。"""
-        project_root = Path(__file__).resolve().parent.parent
-        return project_root / "XDataSaved" / "database"
+        return PROJECT_ROOT / "XDataSaved" / "database"
 
     @classmethod
     def _resolve_filename_base(
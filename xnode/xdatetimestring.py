@@ -5,10 +5,15 @@
 这个模块提供日期时间格式化字符串输出功能。
 """
 
-from datetime import datetime
+import time
 
 from comfy_api.latest import io
 
+try:
+    from ..xz3r0_utils import replace_datetime_tokens
+except ImportError:
+    from xz3r0_utils import replace_datetime_tokens
+
 
 class XDateTimeString(io.ComfyNode):
     """
@@ -99,8 +104,6 @@ class XDateTimeString(io.ComfyNode):
         由于日期时间是实时变化的，返回当前时间戳作为指纹
         确保节点不会缓存结果
         """
-        import time
-
         return time.time()
 
     @classmethod
@@ -122,40 +125,9 @@ class XDateTimeString(io.ComfyNode):
             NodeOutput: 包含格式化后的完整字符串
         """
         # 替换日期时间占位符
-        datetime_str = cls._replace_datetime_placeholders(format_template)
+        datetime_str = replace_datetime_tokens(format_template)
 
         # 组合前缀、日期时间字符串和后缀
         result = f"{prefix}{datetime_str}{suffix}"
 
         return io.NodeOutput(result)
-
-    @classmethod
-    def _replace_datetime_placeholders(cls, text: str) -> str:
-        """
-        替换日期时间标识符
-
-        Args:
-            text: 包含日期时间标识符的文本
-
-        Returns:
-            替换后的文本
-        """
-        if not text:
-            return ""
-
-        now = datetime.now()
-
-        replacements = {
-            "%Y%": now.strftime("%Y"),
-            "%m%": now.strftime("%m"),
-            "%d%": now.strftime("%d"),
-            "%H%": now.strftime("%H"),
-            "%M%": now.strftime("%M"),
-            "%S%": now.strftime("%S"),
-        }
-
-        result = text
-        for placeholder, value in replacements.items():
-            result = result.replace(placeholder, value)
-
-        return result
@@ -8,6 +8,7 @@ XImageGet 节点模块 (V3 API)
 
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 
@@ -314,8 +315,6 @@ class XImageGet(io.ComfyNode):
         x_transform_state: str,
         output_placeholder: bool,
     ) -> int:
-        import hashlib
-
         digest = hashlib.sha1(
             (
                 f"{str(media_ref)}\n"
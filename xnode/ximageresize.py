@@ -345,6 +345,8 @@ class XImageResize(io.ComfyNode):
     ) -> io.NodeOutput:
         """
         批次统一处理图像或遮罩缩放。
+
+        计算出的目标尺寸与输入一致时不做插值，原样返回输入。
         """
         tensor, input_kind, original_dims = cls._normalize_input_tensor(
             image_or_mask
@@ -446,25 +448,19 @@ class XImageResize(io.ComfyNode):
         new_width = max(new_width + width_offset, 1)
         new_height = max(new_height + height_offset, 1)
 
-        data_batch = tensor.movedim(-1, 1)
-        if not data_batch.is_contiguous():
-            data_batch = data_batch.contiguous()
-
-        scaled_batch = comfy.utils.common_upscale(
-            data_batch,
-            new_width,
-            new_height,
-            upscale_method=scale_mode.lower(),
-            crop="disabled",
-        )
-        if scaled_batch.dim() != data_batch.dim():
-            scaled_batch = scaled_batch.movedim(-1, -2).unsqueeze(1)
-        output_tensor = scaled_batch.movedim(1, -1)
-        restored_output = cls._restore_output_tensor(
-            output_tensor,
-            input_kind,
-            original_dims,
-        )
+        if new_width == width and new_height == height:
+            # 目标尺寸与输入一致时插值等同恒等变换，直接透传输入，
+            # 省去整批输出分配和一次完整的插值计算。
+            restored_output = image_or_mask
+        else:
+            output_tensor = cls._resize_batch(
+                tensor, new_width, new_height, scale_mode
+            )
+            restored_output = cls._restore_output_tensor(
+                output_tensor,
+                input_kind,
+                original_dims,
+            )
 
         progress_bar = comfy.utils.ProgressBar(1)
         progress_bar.update_absolute(1)
@@ -510,6 +506,39 @@ class XImageResize(io.ComfyNode):
             f"Expected IMAGE(B,H,W,C) or MASK(H,W)/(B,H,W), got {dims}D tensor"
         )
 
+    @staticmethod
+    def _resize_batch(
+        tensor: torch.Tensor,
+        new_width: int,
+        new_height: int,
+        scale_mode: str,
+    ) -> torch.Tensor:
+        """
+        将 (B,H,W,C) 批次整体缩放到目标尺寸，返回 (B,H',W',C)。
+        """
+        # (B,H,W,C) 经 movedim 后本身就是 channels_last 布局，CPU 上的
+        # 插值内核对该布局有向量化实现，直接沿用可省去一次整批拷贝；
+        # 其他设备仍整理为常规连续布局。
+        memory_format = torch.contiguous_format
+        if tensor.device.type == "cpu":
+            memory_format = torch.channels_last
+        data_batch = tensor.movedim(-1, 1)
+        if not data_batch.is_contiguous(memory_format=memory_format):
+            data_batch = data_batch.contiguous(memory_format=memory_format)
+
+        scaled_batch = comfy.utils.common_upscale(
+            data_batch,
+            new_width,
+            new_height,
+            upscale_method=scale_mode.lower(),
+            crop="disabled",
+        )
+        if scaled_batch.dim() != data_batch.dim():
+            scaled_batch = scaled_batch.movedim(-1, -2).unsqueeze(1)
+        # 输出统一为连续 (B,H,W,C)；CPU 上 channels_last 的结果经 movedim
+        # 后已连续，此处不产生拷贝。
+        return scaled_batch.movedim(1, -1).contiguous()
+
     @staticmethod
     def _restore_output_tensor(
         output_tensor: torch.Tensor,
@@ -666,6 +695,16 @@ class XImageResize(io.ComfyNode):
         if divisor <= 1:
             return value
 
+        # 常用除数 8/16/32/64 均为 2 的幂，取整可直接用位掩码完成；
+        # Nearest 在余数恰为一半时向下取整，与下方通用分支一致。
+        if divisor & (divisor - 1) == 0:
+            mask = divisor - 1
+            if mode == "Down":
+                return value & ~mask
+            if mode == "Up":
+                return (value + mask) & ~mask
+            return (value + (divisor >> 1) - 1) & ~mask
+
         remainder = value % divisor
         if remainder == 0:
             return value
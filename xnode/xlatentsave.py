@@ -6,6 +6,7 @@ Latent 保存节点模块
 """
 
 import json
+from datetime import datetime
 from pathlib import Path
 
 import torch
@@ -189,11 +190,14 @@ class XLatentSave(io.ComfyNode):
         output_dir = cls._get_output_directory()
 
         # 处理日期时间标识符和安全过滤
+        now = datetime.now()
         safe_filename_prefix = sanitize_path_component(filename_prefix)
-        safe_filename_prefix = replace_datetime_tokens(safe_filename_prefix)
+        safe_filename_prefix = replace_datetime_tokens(
+            safe_filename_prefix, now=now
+        )
 
         safe_subfolder = sanitize_path_component(subfolder)
-        safe_subfolder = replace_datetime_tokens(safe_subfolder)
+        safe_subfolder = replace_datetime_tokens(safe_subfolder, now=now)
 
         # 创建完整保存路径
         save_dir = resolve_output_subpath(output_dir, safe_subfolder)
@@ -7,6 +7,7 @@ XLoraGet 节点模块 (V3 API)
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
 from pathlib import Path
@@ -30,6 +31,7 @@ LOGGER = get_logger(__name__)
 
 DEFAULT_STRENGTH = 1.0
 LORA_TRIGGER_DB_NAME = "loras_data.db"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
 class XLoraGet(io.ComfyNode):
@@ -96,8 +98,6 @@ class XLoraGet(io.ComfyNode):
         if model is None and clip is None and not lora_stack.strip():
             return 0
         digest_source = f"{bool(model)}|{bool(clip)}|{lora_stack}"
-        import hashlib
-
         digest = hashlib.sha1(
             digest_source.encode("utf-8", errors="ignore")
         ).hexdigest()
@@ -305,17 +305,12 @@ class XLoraGet(io.ComfyNode):
 
     @staticmethod
     def _db_root() -> Path:
-        return (
-            Path(__file__).resolve().parent.parent / "XDataSaved" / "database"
-        )
+        return PROJECT_ROOT / "XDataSaved" / "database"
 
     @staticmethod
     def _settings_path() -> Path:
         return (
-            Path(__file__).resolve().parent.parent
-            / "XDataSaved"
-            / "settings"
-            / "xdatahub_settings.json"
+            PROJECT_ROOT / "XDataSaved" / "settings" / "xdatahub_settings.json"
         )
 
     @classmethod
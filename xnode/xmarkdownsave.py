@@ -5,6 +5,7 @@ Markdown 保存节点模块
 这个模块包含 Markdown 文本保存相关的节点。
 """
 
+from datetime import datetime
 from pathlib import Path
 
 from comfy_api.latest import io
@@ -261,11 +262,14 @@ class XMarkdownSave(io.ComfyNode):
         """
         output_dir = cls._get_output_directory()
 
+        now = datetime.now()
         safe_filename_prefix = sanitize_path_component(filename_prefix)
-        safe_filename_prefix = replace_datetime_tokens(safe_filename_prefix)
+        safe_filename_prefix = replace_datetime_tokens(
+            safe_filename_prefix, now=now
+        )
 
         safe_subfolder = sanitize_path_component(subfolder)
-        safe_subfolder = replace_datetime_tokens(safe_subfolder)
+        safe_subfolder = replace_datetime_tokens(safe_subfolder, now=now)
 
         save_dir = resolve_output_subpath(output_dir, safe_subfolder)
         try:
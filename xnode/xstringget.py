@@ -7,6 +7,8 @@ XStringGet 节点模块 (V3 API)
 
 from __future__ import annotations
 
+import hashlib
+
 from comfy_api.latest import io
 
 
@@ -77,8 +79,6 @@ class XStringGet(io.ComfyNode):
 
     @staticmethod
     def _fingerprint_text(text_value: str) -> int:
-        import hashlib
-
         digest = hashlib.sha1(
             str(text_value).encode("utf-8", errors="ignore")
         ).hexdigest()
@@ -7,6 +7,7 @@ XVideoGet 节点模块 (V3 API)
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
 from comfy_api.latest import InputImpl, io
@@ -83,8 +84,6 @@ class XVideoGet(io.ComfyNode):
 
     @staticmethod
     def _fingerprint_media_ref(media_ref: str) -> int:
-        import hashlib
-
         digest = hashlib.sha1(
             str(media_ref).encode("utf-8", errors="ignore")
         ).hexdigest()
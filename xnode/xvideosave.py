@@ -9,6 +9,7 @@ import json
 import os
 import shutil
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 import comfy.utils
@@ -215,13 +216,14 @@ class XVideoSave(io.ComfyNode):
         output_dir = cls._get_output_directory()
 
         # 处理日期时间标识符和安全过滤
+        now = datetime.now()
         safe_filename_prefix = sanitize_path_component(filename_prefix)
         safe_filename_prefix = replace_datetime_tokens(
-            safe_filename_prefix
+            safe_filename_prefix, now=now
         )
 
         safe_subfolder = sanitize_path_component(subfolder)
-        safe_subfolder = replace_datetime_tokens(safe_subfolder)
+        safe_subfolder = replace_datetime_tokens(safe_subfolder, now=now)
 
         # 创建完整保存路径
         save_dir = resolve_output_subpath(output_dir, safe_subfolder)
@@ -14,6 +14,7 @@
 
 import json
 import time
+from datetime import datetime
 from pathlib import Path
 
 import folder_paths
@@ -202,11 +203,14 @@ class XWorkflowSave(io.ComfyNode):
         output_dir = Path(folder_paths.get_output_directory())
 
         # Process datetime placeholders and security filtering
+        now = datetime.now()
         safe_filename_prefix = sanitize_path_component(filename_prefix)
-        safe_filename_prefix = replace_datetime_tokens(safe_filename_prefix)
+        safe_filename_prefix = replace_datetime_tokens(
+            safe_filename_prefix, now=now
+        )
 
         safe_subfolder = sanitize_path_component(subfolder)
-        safe_subfolder = replace_datetime_tokens(safe_subfolder)
+        safe_subfolder = replace_datetime_tokens(safe_subfolder, now=now)
 
         # Create full save path
         save_dir = resolve_output_subpath(output_dir, safe_subfolder)
@@ -10,6 +10,7 @@
 
 from .core_db_registry import get_critical_db_names
 from .datetime_tokens import replace_datetime_tokens
+from .ffmpeg_locator import find_ffmpeg
 from .filename_uniqueness import ensure_unique_filename
 from .logging_control import configure_logging, get_logger
 from .output_path_guard import resolve_output_subpath
@@ -25,6 +26,7 @@ from .xdatahub_media_refs import (
 __all__ = [
     "replace_datetime_tokens",
     "ensure_unique_filename",
+    "find_ffmpeg",
     "get_critical_db_names",
     "configure_logging",
     "get_logger",
@@ -7,9 +7,11 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+REGISTRY_PATH = Path(__file__).resolve().parent / "core_db_list.json"
+
 
 def _registry_path() -> Path:
-    return Path(__file__).resolve().parent / "core_db_list.json"
+    return REGISTRY_PATH
 
 
 def get_critical_db_names() -> set[str]:
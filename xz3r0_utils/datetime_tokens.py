@@ -17,9 +17,11 @@ DATETIME_TOKEN_FORMATS = {
     "%M%": "%M",
     "%S%": "%S",
 }
+# 所有字段合并成一个格式串，每次调用只需一次 strftime
+DATETIME_TOKEN_COMBINED_FORMAT = "|".join(DATETIME_TOKEN_FORMATS.values())
 
 
-def replace_datetime_tokens(text: str) -> str:
+def replace_datetime_tokens(text: str, now: datetime | None = None) -> str:
     """
     替换日期时间标识符
 
@@ -33,6 +35,8 @@ def replace_datetime_tokens(text: str) -> str:
 
     Args:
         text: 包含日期时间标识符的文本
+        now: 替换使用的时间点，默认取当前时间；同一次保存中的
+            多个字段传入同一个值，可避免跨秒时结果不一致
 
     Returns:
         替换后的文本
@@ -40,13 +44,20 @@ def replace_datetime_tokens(text: str) -> str:
     if not text:
         return ""
 
-    now = datetime.now()
+    # 不含 "%" 的文本不可能有标识符，直接返回，省去取时间和格式化。
+    if "%" not in text:
+        return text
+
+    if now is None:
+        now = datetime.now()
 
     # 先生成本次调用的替换表，避免在每次匹配时重复格式化时间。
-    replacements = {
-        token: now.strftime(format_str)
-        for token, format_str in DATETIME_TOKEN_FORMATS.items()
-    }
+    replacements = dict(
+        zip(
+            DATETIME_TOKEN_FORMATS,
+            now.strftime(DATETIME_TOKEN_COMBINED_FORMAT).split("|"),
+        )
+    )
 
     def replace_match(match: re.Match[str]) -> str:
         """
@@ -0,0 +1,27 @@
+"""
+FFmpeg 可执行文件定位工具
+=========================
+
+这个模块只负责查找系统 PATH 中的 ffmpeg 可执行文件，并在进程内
+缓存已找到的路径，避免各节点和接口每次调用都重新遍历 PATH。
+"""
+
+import shutil
+
+_ffmpeg_path: str | None = None
+
+
+def find_ffmpeg() -> str | None:
+    """
+    查找 ffmpeg 可执行文件路径
+
+    只缓存找到的路径；未找到时不缓存，下一次调用会重新查找，
+    用户在运行期间安装 ffmpeg 后无需重启即可生效。
+
+    Returns:
+        ffmpeg 可执行文件路径，未找到时返回 None
+    """
+    global _ffmpeg_path
+    if _ffmpeg_path is None:
+        _ffmpeg_path = shutil.which("ffmpeg")
+    return _ffmpeg_path
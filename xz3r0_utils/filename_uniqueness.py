@@ -5,6 +5,7 @@
 这个模块只负责为保存文件生成不覆盖旧文件的唯一文件名。
 """
 
+import os
 from pathlib import Path
 
 DEFAULT_MAX_FILENAME_ATTEMPTS = 100000
@@ -37,6 +38,10 @@ def ensure_unique_filename(
     if max_attempts < 1:
         raise ValueError("max_attempts must be >= 1")
 
+    # 一次 scandir 读出目录内已有文件名，后续候选只做集合查询，
+    # 避免序列号很大时逐个 stat。目录无法列举时退回逐个探测。
+    existing_names = _list_existing_names(directory)
+
     # 第一次优先尝试原始文件名，后续再按五位序列号递增。
     for counter in range(max_attempts):
         if counter == 0:
@@ -44,8 +49,30 @@ def ensure_unique_filename(
         else:
             candidate = f"{filename}_{counter:05d}{extension}"
 
-        candidate_path = directory / candidate
-        if not candidate_path.exists():
+        if (
+            existing_names is not None
+            and os.path.normcase(candidate) in existing_names
+        ):
+            continue
+
+        # 扫描之后可能有其他写入者创建了同名文件，
+        # 返回前对选中的候选再做一次 stat 确认。
+        if not (directory / candidate).exists():
             return candidate
 
     raise FileExistsError("Unable to generate unique filename")
+
+
+def _list_existing_names(directory: Path) -> set[str] | None:
+    """
+    列出目录内已有条目名称，按平台规则做大小写归一化。
+
+    目录不存在时返回空集合，其他读取失败时返回 None。
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name) for entry in entries}
+    except FileNotFoundError:
+        return set()
+    except OSError:
+        return None
@@ -6,28 +6,12 @@
 危险内容，避免路径遍历和多级路径注入。
 """
 
-import re
-
-PATH_COMPONENT_DANGEROUS_CHARS = [
-    "\\",
-    "/",
-    "..",
-    ".",
-    "|",
-    ":",
-    "*",
-    "?",
-    '"',
-    "<",
-    ">",
-    "\n",
-    "\r",
-    "\t",
-    "\x00",
-    "\x0b",
-    "\x0c",
-]
-PATH_COMPONENT_UNDERSCORE_PATTERN = re.compile(r"_+")
+PATH_COMPONENT_DANGEROUS_CHARS = "\\/.|:*?\"<>\n\r\t\x00\x0b\x0c~"
+# 所有危险字符一次性映射为下划线；".." 会变成 "__"，
+# 随后与其他连续下划线一起被合并，结果与逐个替换一致。
+PATH_COMPONENT_TRANSLATION = str.maketrans(
+    dict.fromkeys(PATH_COMPONENT_DANGEROUS_CHARS, "_")
+)
 
 
 def sanitize_path_component(path_str: str) -> str:
@@ -46,14 +30,9 @@ def sanitize_path_component(path_str: str) -> str:
     if not path_str:
         return ""
 
-    safe_path = path_str
+    # 单次 translate 替换所有危险字符（含波浪线），阻断多级路径和
+    # 非法文件名。
+    safe_path = path_str.translate(PATH_COMPONENT_TRANSLATION)
 
-    # 先替换明显危险的路径字符，阻断多级路径和非法文件名。
-    for char in PATH_COMPONENT_DANGEROUS_CHARS:
-        safe_path = safe_path.replace(char, "_")
-
-    # 单独处理波浪线，保持与原始节点实现的清理结果一致。
-    safe_path = safe_path.replace("~", "_")
-
-    safe_path = PATH_COMPONENT_UNDERSCORE_PATTERN.sub("_", safe_path)
-    return safe_path.strip("_")
+    # 按下划线切分后丢弃空段再拼回，一次完成连续下划线合并和首尾清理。
+    return "_".join(filter(None, safe_path.split("_")))
@@ -27,6 +27,7 @@ PUBLIC_REF_ALLOWED = set(
     "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_"
 )
 CUSTOM_ROOT_PREFIX = "custom_"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
 @dataclass(frozen=True)
@@ -48,12 +49,7 @@ def media_index_db_path() -> Path:
     """
     返回 XDataHub 媒体索引数据库路径。
     """
-    return (
-        Path(__file__).resolve().parent.parent
-        / "XDataSaved"
-        / "database"
-        / "media_index.db"
-    )
+    return PROJECT_ROOT / "XDataSaved" / "database" / "media_index.db"
 
 
 def xdatahub_settings_path() -> Path:
@@ -61,10 +57,7 @@ def xdatahub_settings_path() -> Path:
     返回 XDataHub 设置文件路径。
     """
     return (
-        Path(__file__).resolve().parent.parent
-        / "XDataSaved"
-        / "settings"
-        / "xdatahub_settings.json"
+        PROJECT_ROOT / "XDataSaved" / "settings" / "xdatahub_settings.json"
     )
 
 